@@ -18,20 +18,33 @@ Usage:
     python claude_agent.py --dry-run          # Simulate; no file changes
     python claude_agent.py --update-dashboard # Dashboard refresh only
     python claude_agent.py --scan             # List tasks without processing
+    python claude_agent.py --workers 4        # Process up to 4 tasks concurrently
 
 Environment:
     DRY_RUN=true   Enable dry-run (same as --dry-run flag)
 """
 
+import io
 import os
+import re
 import sys
 import json
+import errno
+import atexit
 import shutil
+import sqlite3
 import logging
+import logging.handlers
+import functools
+import heapq
 import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
-from typing import Optional
+from typing import NamedTuple, Optional, TextIO
 
 # Load .env so DRY_RUN (and Silver+ keys) are available
 try:
@@ -70,21 +83,69 @@ TIER          = "bronze"
 
 DRY_RUN = os.environ.get("DRY_RUN", "false").lower() in ("true", "1", "yes")
 
+# ──────────────────────────────────────────────────────────────────────────────
+# VAULT DIRECTORIES
+# ──────────────────────────────────────────────────────────────────────────────
+
+# Directories known to exist; writers skip mkdir for these. A failed write
+# discards its directory so the next attempt re-creates it.
+_KNOWN_DIRS: set[Path] = set()
+
+
+def _ensure_dir(directory: Path) -> None:
+    """Create a vault directory (and parents) unless it is already known to exist."""
+    if directory in _KNOWN_DIRS:
+        return
+    directory.mkdir(parents=True, exist_ok=True)
+    _KNOWN_DIRS.add(directory)
+
+
+def _ensure_dirs() -> None:
+    """Create every standard vault folder once, at import."""
+    for directory in (INBOX_DIR, NEEDS_ACTION_DIR, DONE_DIR, PLANS_DIR,
+                      PENDING_APPROVAL_DIR, APPROVED_DIR, REJECTED_DIR,
+                      LOGS_DIR, SKILLS_DIR):
+        _ensure_dir(directory)
+
+
+_ensure_dirs()
+
 # ──────────────────────────────────────────────────────────────────────────────
 # LOGGING
 # ──────────────────────────────────────────────────────────────────────────────
 
-LOGS_DIR.mkdir(parents=True, exist_ok=True)
-
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)-8s] %(name)s: %(message)s",
-    datefmt="%Y-%m-%d %H:%M:%S",
-    handlers=[
-        logging.FileHandler(LOGS_DIR / "agent.log", encoding="utf-8"),
-        logging.StreamHandler(sys.stdout),
-    ],
-)
+_LOG_FORMAT  = "%(asctime)s [%(levelname)-8s] %(name)s: %(message)s"
+_LOG_DATEFMT = "%Y-%m-%d %H:%M:%S"
+
+_log_file_handler = logging.FileHandler(LOGS_DIR / "agent.log", encoding="utf-8")
+_log_file_handler.setFormatter(logging.Formatter(_LOG_FORMAT, _LOG_DATEFMT))
+
+if logging.getLogger().handlers:
+    # Imported by a host that already configured logging (watcher.py runs the
+    # agent in-process): keep agent.log current and echo to the console, but
+    # don't propagate, so the host's own log file (watcher.log) stays its own.
+    _console_handler = logging.StreamHandler(sys.stdout)
+    _console_handler.setFormatter(logging.Formatter(_LOG_FORMAT, _LOG_DATEFMT))
+    _agent_logger = logging.getLogger("ClaudeAgent")
+    _agent_logger.addHandler(_log_file_handler)
+    _agent_logger.addHandler(_console_handler)
+    _agent_logger.propagate = False
+else:
+    # CLI run: agent.log is written in batches — records queue in memory and
+    # reach disk every 256 lines, on any ERROR, or when logging shuts down at
+    # exit. The console handler stays unbuffered so progress still shows live.
+    logging.basicConfig(
+        level=logging.INFO,
+        format=_LOG_FORMAT,
+        datefmt=_LOG_DATEFMT,
+        handlers=[
+            logging.handlers.MemoryHandler(
+                capacity=256, flushLevel=logging.ERROR, target=_log_file_handler
+            ),
+            logging.StreamHandler(sys.stdout),
+        ],
+    )
+
 logger = logging.getLogger("ClaudeAgent")
 
 
@@ -93,6 +154,48 @@ logger = logging.getLogger("ClaudeAgent")
 # See: Skills/vault_reader.md
 # ══════════════════════════════════════════════════════════════════════════════
 
+class VaultEntry(NamedTuple):
+    """A file captured by VaultReader.list_files() — stat data from one scandir pass."""
+    path : Path
+    mtime: float
+    size : int
+
+
+_by_mtime = attrgetter("mtime")
+
+
+@dataclass(slots=True)
+class TaskDescriptor:
+    """
+    One task in Needs_Action/ as produced by VaultReader.scan_needs_action().
+
+    The classification fields keep their defaults until TaskClassifier.classify()
+    fills them in place. The meta file is only read if meta_content is accessed.
+    """
+    task_file: Path
+    meta_file: Optional[Path]
+    name     : str
+    stem     : str
+    extension: str
+    size     : int
+    modified : datetime
+
+    task_type         : str  = "unknown"
+    priority          : str  = "medium"
+    action            : str  = "general_processing"
+    requires_approval : bool = False
+    classifier_version: str  = "unknown"
+
+    _meta_text: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def meta_content(self) -> Optional[str]:
+        """Text of the _meta.md companion, read on first access (None if absent)."""
+        if self._meta_text is None and self.meta_file is not None:
+            self._meta_text = VaultReader.read_file(self.meta_file)
+        return self._meta_text
+
+
 class VaultReader:
     """
     Reads content and lists files from the vault.
@@ -101,6 +204,12 @@ class VaultReader:
     Silver+: [LLM_HOOK] Can be backed by MCP filesystem server.
     """
 
+    # (directory, suffix) → (directory st_mtime_ns, entries). A listing is reused
+    # until the directory's own mtime changes or a vault write invalidates it.
+    _dir_cache: dict[tuple[Path, Optional[str]], tuple[int, list[VaultEntry]]] = {}
+    _DIR_CACHE_MAX = 32
+    _dir_cache_lock = threading.Lock()
+
     @staticmethod
     def read_file(path: Path) -> Optional[str]:
         """Return text content of a vault file, or None on failure."""
@@ -111,48 +220,113 @@ class VaultReader:
             return None
 
     @staticmethod
-    def list_files(directory: Path, suffix: str = None) -> list[Path]:
-        """Return sorted list of files in a vault directory."""
-        if not directory.exists():
-            return []
+    def list_files(directory: Path, suffix: str = None, *,
+                   limit: int = None, newest_first: bool = False) -> list[VaultEntry]:
+        """
+        Return (path, mtime, size) entries for files in a vault directory, sorted by mtime.
+
+        A single os.scandir() pass supplies both the listing and the stat data,
+        so callers never need to stat the returned paths again. Listings are
+        cached per (directory, suffix) and revalidated against the directory mtime.
+
+        limit       : return only the first `limit` entries, selected with a heap
+                      (O(N log limit)) instead of sorting the whole directory.
+        newest_first: order by descending mtime.
+        """
         try:
-            files = [f for f in directory.iterdir() if f.is_file()]
-            if suffix:
-                files = [f for f in files if f.suffix.lower() == suffix.lower()]
-            return sorted(files, key=lambda f: f.stat().st_mtime)
+            entries = VaultReader._scan(directory, suffix)
+        except FileNotFoundError:
+            return []
         except Exception as exc:
             logger.error(f"VaultReader.list_files({directory.name}): {exc}")
             return []
+        if limit is not None:
+            select = heapq.nlargest if newest_first else heapq.nsmallest
+            return select(limit, entries, key=_by_mtime)
+        return sorted(entries, key=_by_mtime, reverse=newest_first)
+
+    @staticmethod
+    def count_files(directory: Path, suffix: str = None, *, since: float = None) -> int:
+        """Return how many files a vault directory holds (optionally with mtime >= since), without sorting."""
+        try:
+            entries = VaultReader._scan(directory, suffix)
+        except FileNotFoundError:
+            return 0
+        except Exception as exc:
+            logger.error(f"VaultReader.count_files({directory.name}): {exc}")
+            return 0
+        if since is None:
+            return len(entries)
+        return sum(1 for e in entries if e.mtime >= since)
+
+    @staticmethod
+    def _scan(directory: Path, suffix: Optional[str]) -> list[VaultEntry]:
+        """Return the cached, unordered listing for (directory, suffix); rescan if stale."""
+        suffix = suffix.lower() if suffix else None
+        key    = (directory, suffix)
+        cache  = VaultReader._dir_cache
+
+        dir_mtime = directory.stat().st_mtime_ns
+        cached = cache.get(key)
+        if cached and cached[0] == dir_mtime:
+            return cached[1]
+
+        entries = []
+        with os.scandir(directory) as it:
+            for e in it:
+                if not e.is_file():
+                    continue
+                if suffix and os.path.splitext(e.name)[1].lower() != suffix:
+                    continue
+                st = e.stat()
+                entries.append(VaultEntry(Path(e.path), st.st_mtime, st.st_size))
+
+        with VaultReader._dir_cache_lock:
+            if key not in cache and len(cache) >= VaultReader._DIR_CACHE_MAX:
+                cache.pop(next(iter(cache)), None)   # FIFO eviction
+            cache[key] = (dir_mtime, entries)
+        return entries
 
     @staticmethod
-    def scan_needs_action() -> list[dict]:
+    def invalidate(directory: Path) -> None:
+        """Drop cached listings for a directory after the vault writes into it."""
+        with VaultReader._dir_cache_lock:
+            for key in [k for k in VaultReader._dir_cache if k[0] == directory]:
+                del VaultReader._dir_cache[key]
+
+    @staticmethod
+    def scan_needs_action() -> list[TaskDescriptor]:
         """
         Scan Needs_Action/ and return task descriptors.
         Each descriptor pairs a task file with its _meta.md counterpart.
         """
-        all_files = VaultReader.list_files(NEEDS_ACTION_DIR)
-        meta_names = {f.name for f in all_files if f.stem.endswith("_meta")}
+        all_entries = VaultReader.list_files(NEEDS_ACTION_DIR)
 
-        # Task files are non-meta, non-markdown files
-        task_files = [
-            f for f in all_files
-            if f.name not in meta_names and f.suffix.lower() != ".md"
+        # Pair task stems with their _meta.md from the same listing — no exists() probes
+        meta_paths = {
+            e.path.name[:-len("_meta.md")]: e.path for e in all_entries
+            if e.path.name.endswith("_meta.md")
+        }
+
+        # Task files are non-meta, non-markdown files; dotfiles are in-progress watcher copies
+        task_entries = [
+            e for e in all_entries
+            if not e.path.stem.endswith("_meta") and e.path.suffix.lower() != ".md"
+            and not e.path.name.startswith(".")
         ]
 
         tasks = []
-        for tf in task_files:
-            meta_name = tf.stem + "_meta.md"
-            meta_path = NEEDS_ACTION_DIR / meta_name
-            tasks.append({
-                "task_file" : tf,
-                "meta_file" : meta_path if meta_path.exists() else None,
-                "meta_content": VaultReader.read_file(meta_path) if meta_path.exists() else None,
-                "name"      : tf.name,
-                "stem"      : tf.stem,
-                "extension" : tf.suffix.lower(),
-                "size"      : tf.stat().st_size,
-                "modified"  : datetime.fromtimestamp(tf.stat().st_mtime),
-            })
+        for entry in task_entries:
+            tf = entry.path
+            tasks.append(TaskDescriptor(
+                task_file = tf,
+                meta_file = meta_paths.get(tf.stem),
+                name      = tf.name,
+                stem      = tf.stem,
+                extension = tf.suffix.lower(),
+                size      = entry.size,
+                modified  = datetime.fromtimestamp(entry.mtime),
+            ))
         return tasks
 
 
@@ -169,6 +343,14 @@ class VaultWriter:
     Silver+: [LLM_HOOK] Can be backed by MCP filesystem server.
     """
 
+    # append() keeps one buffered handle per file open for the whole process
+    # (one open/close per log file instead of per entry); flushed every
+    # _APPEND_FLUSH_EVERY records and by flush_appends(), closed at exit.
+    _append_handles: dict[Path, TextIO] = {}
+    _append_pending: dict[Path, int] = {}
+    _append_lock = threading.Lock()
+    _APPEND_FLUSH_EVERY = 1000
+
     @staticmethod
     def write(path: Path, content: str, overwrite: bool = True) -> bool:
         """Write text to a vault file. Returns True on success."""
@@ -179,12 +361,34 @@ class VaultWriter:
             logger.info(f"[DRY_RUN] Would write {len(content):,} bytes → {path}")
             return True
         try:
-            path.parent.mkdir(parents=True, exist_ok=True)
+            _ensure_dir(path.parent)
             path.write_text(content, encoding="utf-8")
+            VaultReader.invalidate(path.parent)
             logger.debug(f"Written: {path.name} ({len(content):,} bytes)")
             return True
         except Exception as exc:
             logger.error(f"VaultWriter.write({path.name}): {exc}")
+            _KNOWN_DIRS.discard(path.parent)
+            return False
+
+    @staticmethod
+    def write_parts(path: Path, parts: list[str], overwrite: bool = True) -> bool:
+        """Write text fragments to a vault file in one pass, without joining them first."""
+        if path.exists() and not overwrite:
+            logger.warning(f"VaultWriter.write_parts: exists, overwrite=False: {path.name}")
+            return False
+        if DRY_RUN:
+            logger.info(f"[DRY_RUN] Would write {sum(map(len, parts)):,} chars → {path}")
+            return True
+        try:
+            _ensure_dir(path.parent)
+            with open(path, "w", encoding="utf-8") as fh:
+                fh.writelines(parts)
+            VaultReader.invalidate(path.parent)
+            return True
+        except Exception as exc:
+            logger.error(f"VaultWriter.write_parts({path.name}): {exc}")
+            _KNOWN_DIRS.discard(path.parent)
             return False
 
     @staticmethod
@@ -194,13 +398,51 @@ class VaultWriter:
             logger.info(f"[DRY_RUN] Would append to: {path.name}")
             return True
         try:
-            with open(path, "a", encoding="utf-8") as fh:
+            with VaultWriter._append_lock:
+                fh = VaultWriter._append_handles.get(path)
+                if fh is None:
+                    fh = open(path, "a", encoding="utf-8", buffering=1 << 16)
+                    VaultWriter._append_handles[path] = fh
                 fh.write(content)
+                pending = VaultWriter._append_pending.get(path, 0) + 1
+                if pending >= VaultWriter._APPEND_FLUSH_EVERY:
+                    fh.flush()
+                    pending = 0
+                VaultWriter._append_pending[path] = pending
+            VaultReader.invalidate(path.parent)
             return True
         except Exception as exc:
             logger.error(f"VaultWriter.append({path.name}): {exc}")
             return False
 
+    @staticmethod
+    def flush_appends(sync: bool = False) -> None:
+        """Push buffered append() data to disk; sync=True also fsyncs each file."""
+        with VaultWriter._append_lock:
+            for path, fh in VaultWriter._append_handles.items():
+                try:
+                    fh.flush()
+                    if sync:
+                        os.fsync(fh.fileno())
+                except Exception as exc:
+                    logger.error(f"VaultWriter.flush_appends({path.name}): {exc}")
+            VaultWriter._append_pending.clear()
+
+    @staticmethod
+    def close_appends() -> None:
+        """Flush and close every handle opened by append()."""
+        with VaultWriter._append_lock:
+            for path, fh in VaultWriter._append_handles.items():
+                try:
+                    fh.close()
+                except Exception as exc:
+                    logger.error(f"VaultWriter.close_appends({path.name}): {exc}")
+            VaultWriter._append_handles.clear()
+            VaultWriter._append_pending.clear()
+
+
+atexit.register(VaultWriter.close_appends)
+
 
 # ══════════════════════════════════════════════════════════════════════════════
 # SKILL 3 — TASK CLASSIFIER
@@ -209,7 +451,7 @@ class VaultWriter:
 
 class TaskClassifier:
     """
-    Classifies a task dict by type, priority, required action, and approval need.
+    Classifies a task by type, priority, required action, and approval need.
 
     Bronze : Rule-based (filename + extension heuristics).
     Silver+: [LLM_HOOK] Replace classify() body with LLM call:
@@ -229,6 +471,11 @@ class TaskClassifier:
         "data"       : [".csv", ".tsv", ".xml"],
     }
 
+    # Inverted once at class creation: extension → type is a single hash lookup
+    _EXT_TO_TYPE: dict[str, str] = {
+        ext: tname for tname, exts in _TYPE_MAP.items() for ext in exts
+    }
+
     _PRIORITY_KEYWORDS: dict[str, list[str]] = {
         "urgent": ["urgent", "asap", "critical", "emergency", "immediate"],
         "high"  : ["important", "high", "priority", "deadline", "needed"],
@@ -258,40 +505,44 @@ class TaskClassifier:
         "invoice" : "generate_summary",
     }
 
-    @classmethod
-    def classify(cls, task: dict) -> dict:
+    # Keyword tables compiled once into regexes. Precedence is unchanged: the
+    # first priority level with any hit wins, and among action keywords the
+    # one listed first in _KEYWORD_ACTIONS wins wherever it sits in the name
+    # (the lookahead reports overlapping hits so none is shadowed).
+    _PRIORITY_RE: dict[str, re.Pattern] = {
+        level: re.compile("|".join(map(re.escape, keywords)))
+        for level, keywords in _PRIORITY_KEYWORDS.items()
+    }
+    _KW_ACTION_RE = re.compile("(?=(" + "|".join(map(re.escape, _KEYWORD_ACTIONS)) + "))")
+    _KW_RANK: dict[str, int] = {kw: rank for rank, kw in enumerate(_KEYWORD_ACTIONS)}
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _classify_pure(name_lower: str, ext: str) -> tuple[str, str, str, bool]:
         """
-        Enrich a task dict with classification fields.
-        Returns updated dict with: task_type, priority, action, requires_approval.
+        Rule-based classification of a (lower-cased name, extension) pair.
+        Returns (task_type, priority, action, requires_approval).
 
-        # [LLM_HOOK] Silver+:
-        # prompt = build_classify_prompt(task, handbook_content, business_goals)
-        # result = llm.complete(prompt)
-        # return {**task, **parse_classification(result)}
+        Pure, so memoized: recurring task names (daily reports, repeat
+        invoices) are a dict hit, and the cache outlives a single run().
         """
-        name_lower = task["name"].lower()
-        ext        = task["extension"]
+        cls = TaskClassifier
 
         # Determine task type
-        task_type = "unknown"
-        for tname, exts in cls._TYPE_MAP.items():
-            if ext in exts:
-                task_type = tname
-                break
+        task_type = cls._EXT_TO_TYPE.get(ext, "unknown")
 
         # Determine priority
         priority = "medium"
-        for level, keywords in cls._PRIORITY_KEYWORDS.items():
-            if any(kw in name_lower for kw in keywords):
+        for level, pattern in cls._PRIORITY_RE.items():
+            if pattern.search(name_lower):
                 priority = level
                 break
 
         # Determine action (keyword override → type default)
         action = cls._ACTION_MAP.get(task_type, "general_processing")
-        for kw, kw_action in cls._KEYWORD_ACTIONS.items():
-            if kw in name_lower:
-                action = kw_action
-                break
+        hits = {m.group(1) for m in cls._KW_ACTION_RE.finditer(name_lower)}
+        if hits:
+            action = cls._KEYWORD_ACTIONS[min(hits, key=cls._KW_RANK.__getitem__)]
 
         # Safety gate: some task types always require human approval
         requires_approval = (
@@ -299,14 +550,30 @@ class TaskClassifier:
             or task_type in {"email", "code"}   # potential external impact
         )
 
-        return {
-            **task,
-            "task_type"          : task_type,
-            "priority"           : priority,
-            "action"             : action,
-            "requires_approval"  : requires_approval,
-            "classifier_version" : f"{AGENT_VERSION}-bronze",
-        }
+        return task_type, priority, action, requires_approval
+
+    @classmethod
+    def classify(cls, task: TaskDescriptor) -> TaskDescriptor:
+        """
+        Fill in a task's classification fields in place and return the same task.
+        Sets: task_type, priority, action, requires_approval, classifier_version.
+
+        # [LLM_HOOK] Silver+:
+        # prompt = build_classify_prompt(task, handbook_content, business_goals)
+        # result = llm.complete(prompt)
+        # for field, value in parse_classification(result).items():
+        #     setattr(task, field, value)
+        """
+        task_type, priority, action, requires_approval = cls._classify_pure(
+            task.name.lower(), task.extension
+        )
+
+        task.task_type          = task_type
+        task.priority           = priority
+        task.action             = action
+        task.requires_approval  = requires_approval
+        task.classifier_version = f"{AGENT_VERSION}-bronze"
+        return task
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -319,7 +586,7 @@ class PlanGenerator:
     Generates a Plan.md checklist for a classified task.
 
     Bronze : Template-based plans keyed on task action.
-    Silver+: [LLM_HOOK] Replace _get_steps() with LLM plan generation.
+    Silver+: [LLM_HOOK] Replace _get_steps() / _get_checklist() with LLM plan generation.
     """
 
     _STEPS: dict[str, list[str]] = {
@@ -405,23 +672,13 @@ class PlanGenerator:
         ],
     }
 
-    @classmethod
-    def generate(cls, task: dict) -> str:
-        """
-        Return Plan.md content for the given task.
+    # Static plan fragments are built once; only the header varies per task
+    _CHECKLISTS: dict[str, str] = {
+        action: "\n".join(f"- [ ] {s}" for s in steps)
+        for action, steps in _STEPS.items()
+    }
 
-        # [LLM_HOOK] Silver+:
-        # context = load_handbook() + load_business_goals()
-        # steps = llm.generate_plan(task, context)
-        """
-        now    = datetime.now()
-        action = task.get("action", "general_processing")
-        steps  = cls._get_steps(action)
-        checklist = "\n".join(f"- [ ] {s}" for s in steps)
-
-        approval_block = ""
-        if task.get("requires_approval"):
-            approval_block = """
+    _APPROVAL_BLOCK = """
 ## ⚠️ Human Approval Required
 
 This task requires human review before execution because it either:
@@ -436,34 +693,9 @@ To proceed:
 - **Modify**  → Edit checklist, then move to `Approved/`
 """
 
-        return f"""---
-title: "Plan: {task['name']}"
-task_file: "{task['name']}"
-task_type: "{task.get('task_type', 'unknown')}"
-priority: "{task.get('priority', 'medium')}"
-action: "{action}"
-requires_approval: {str(task.get('requires_approval', False)).lower()}
-created: "{now.strftime('%Y-%m-%d %H:%M:%S')}"
-status: "pending"
-tier: "{TIER}"
----
-
-# Plan: {task['name']}
-
-| Field | Value |
-|-------|-------|
-| Created | {now.strftime('%Y-%m-%d %H:%M:%S')} |
-| File | `{task['name']}` |
-| Type | {task.get('task_type', 'unknown').replace('_', ' ').title()} |
-| Priority | **{task.get('priority', 'medium').upper()}** |
-| Action | {action.replace('_', ' ').title()} |
-| Size | {task.get('size', 0):,} bytes |
-| Detected | {task.get('modified', now).strftime('%Y-%m-%d %H:%M:%S')} |
-| Requires Approval | {'**Yes ⚠️**' if task.get('requires_approval') else 'No'} |
-{approval_block}
-## Execution Checklist
+    _CHECKLIST_HEADING = "\n## Execution Checklist\n\n"
 
-{checklist}
+    _FOOTER = f"""
 
 ## Observations
 
@@ -479,13 +711,85 @@ tier: "{TIER}"
 
 ---
 *Generated by PlanGenerator v{AGENT_VERSION} (Bronze Tier)*
-*Classifier: {task.get('classifier_version', 'unknown')}*
 """
 
+    @classmethod
+    def generate(cls, task: TaskDescriptor, now: datetime = None) -> str:
+        """
+        Return Plan.md content for the given task.
+
+        # [LLM_HOOK] Silver+:
+        # context = load_handbook() + load_business_goals()
+        # steps = llm.generate_plan(task, context)
+        """
+        return "".join(cls.generate_parts(task, now))
+
+    @classmethod
+    def generate_parts(cls, task: TaskDescriptor, now: datetime = None) -> list[str]:
+        """
+        Return Plan.md content as ordered fragments for VaultWriter.write_parts().
+
+        now: "created" timestamp; ActionProcessor passes its run start so a
+        batch shares one clock read.
+        """
+        now     = now or datetime.now()
+        now_str = now.strftime('%Y-%m-%d %H:%M:%S')
+        action  = task.action
+
+        header = f"""---
+title: "Plan: {task.name}"
+task_file: "{task.name}"
+task_type: "{task.task_type}"
+priority: "{task.priority}"
+action: "{action}"
+requires_approval: {str(task.requires_approval).lower()}
+created: "{now_str}"
+status: "pending"
+tier: "{TIER}"
+---
+
+# Plan: {task.name}
+
+| Field | Value |
+|-------|-------|
+| Created | {now_str} |
+| File | `{task.name}` |
+| Type | {task.task_type.replace('_', ' ').title()} |
+| Priority | **{task.priority.upper()}** |
+| Action | {action.replace('_', ' ').title()} |
+| Size | {task.size:,} bytes |
+| Detected | {task.modified.strftime('%Y-%m-%d %H:%M:%S')} |
+| Requires Approval | {'**Yes ⚠️**' if task.requires_approval else 'No'} |
+"""
+        return [header, cls._body(action, task.requires_approval, task.classifier_version)]
+
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _body(action: str, requires_approval: bool, classifier_version: str) -> str:
+        """
+        Everything below the header, rendered once per classification.
+
+        Plans stay separate files (they are edited by hand, so sharing one
+        via hardlinks would leak edits between tasks); only the rendering is
+        shared.
+        """
+        cls = PlanGenerator
+        return "".join((
+            cls._APPROVAL_BLOCK if requires_approval else "",
+            cls._CHECKLIST_HEADING,
+            cls._get_checklist(action),
+            cls._FOOTER,
+            f"*Classifier: {classifier_version}*\n",
+        ))
+
     @classmethod
     def _get_steps(cls, action: str) -> list[str]:
         return cls._STEPS.get(action, cls._STEPS["general_processing"])
 
+    @classmethod
+    def _get_checklist(cls, action: str) -> str:
+        return cls._CHECKLISTS.get(action, cls._CHECKLISTS["general_processing"])
+
 
 # ══════════════════════════════════════════════════════════════════════════════
 # SKILL 5 — FILE MOVER
@@ -496,8 +800,10 @@ class FileMover:
     """
     Safely moves or copies files between vault folders.
 
-    Uses copy-verify-delete pattern:  never delete source until destination
-    is confirmed to exist at the correct size.
+    Moves are a single atomic rename when source and destination share a
+    filesystem (always the case inside the vault). Cross-device moves fall
+    back to copy-verify-delete: never delete source until destination is
+    confirmed to exist at the correct size.
 
     Bronze : Local shutil operations.
     Silver+: [LLM_HOOK] Can be backed by MCP filesystem server.
@@ -509,28 +815,39 @@ class FileMover:
         Move source to dest_dir (with optional rename).
         Returns destination Path on success, None on failure.
         """
-        dest_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(dest_dir)
         dest_name = new_name or source.name
-        dest_path = FileMover._safe_path(dest_dir / dest_name)
 
         if DRY_RUN:
+            dest_path = FileMover._safe_path(dest_dir / dest_name)
             logger.info(f"[DRY_RUN] Would move: {source.name} → {dest_dir.name}/{dest_path.name}")
             return dest_path
 
+        dest_path = None
+        moved     = False   # Set once the file is at dest_path and gone from source
         try:
-            shutil.copy2(source, dest_path)
-            # Verify before deleting source
-            if not dest_path.exists():
-                raise RuntimeError("Destination not found after copy")
-            if dest_path.stat().st_size != source.stat().st_size:
-                raise RuntimeError("Size mismatch after copy")
-            source.unlink()
+            # Claim the name first, then rename over the empty placeholder
+            dest_path = FileMover._reserve(dest_dir / dest_name)
+            try:
+                os.replace(source, dest_path)
+            except OSError as exc:
+                if exc.errno != errno.EXDEV:
+                    raise
+                # Cross-device: copy, verify before deleting source
+                FileMover._fast_copy(source, dest_path)
+                if dest_path.stat().st_size != source.stat().st_size:
+                    raise RuntimeError("Size mismatch after copy")
+                source.unlink()
+            moved = True
+            VaultReader.invalidate(source.parent)
+            VaultReader.invalidate(dest_dir)
             logger.info(f"Moved: {source.name} → {dest_dir.name}/{dest_path.name}")
             return dest_path
         except Exception as exc:
             logger.error(f"FileMover.move({source.name}): {exc}")
-            # Clean up partial copy
-            if dest_path.exists() and source.exists():
+            _KNOWN_DIRS.discard(dest_dir)
+            # Clean up placeholder / partial copy, even if the source is gone
+            if dest_path and not moved:
                 try:
                     dest_path.unlink()
                 except Exception:
@@ -539,24 +856,103 @@ class FileMover:
 
     @staticmethod
     def copy_to(source: Path, dest_dir: Path, new_name: str = None) -> Optional[Path]:
-        """Copy source to dest_dir without removing source."""
-        dest_dir.mkdir(parents=True, exist_ok=True)
-        dest_path = FileMover._safe_path(dest_dir / (new_name or source.name))
+        """
+        Copy source to dest_dir without removing source.
+
+        Content only: the copy is a fresh file (e.g. a plan dropped into
+        Pending_Approval/), so timestamps and permissions are not carried over.
+        """
+        _ensure_dir(dest_dir)
+        dest_name = new_name or source.name
 
         if DRY_RUN:
             logger.info(f"[DRY_RUN] Would copy: {source.name} → {dest_dir.name}/")
-            return dest_path
+            return FileMover._safe_path(dest_dir / dest_name)
 
+        dest_path = None
         try:
-            shutil.copy2(source, dest_path)
+            dest_path = FileMover._reserve(dest_dir / dest_name)
+            FileMover._copy_nometa(source, dest_path)
+            VaultReader.invalidate(dest_dir)
             return dest_path
         except Exception as exc:
             logger.error(f"FileMover.copy_to({source.name}): {exc}")
+            _KNOWN_DIRS.discard(dest_dir)
+            if dest_path:
+                try:
+                    dest_path.unlink()
+                except Exception:
+                    pass
             return None
 
+    @staticmethod
+    def claim(path: Path) -> Optional[Path]:
+        """
+        Claim a free name for a new vault file the caller is about to write.
+        Returns the reserved Path (path, or path_1, ...), None on failure.
+        """
+        if DRY_RUN:
+            return FileMover._safe_path(path)
+        try:
+            _ensure_dir(path.parent)
+            return FileMover._reserve(path)
+        except Exception as exc:
+            logger.error(f"FileMover.claim({path.name}): {exc}")
+            _KNOWN_DIRS.discard(path.parent)
+            return None
+
+    # copy_file_range errors that mean "not supported here" rather than a real failure
+    _COPY_RANGE_FALLBACK = frozenset({errno.ENOSYS, errno.EXDEV, errno.EINVAL,
+                                      errno.EOPNOTSUPP, errno.EPERM})
+
+    @staticmethod
+    def _fast_copy(source: Path, dest: Path) -> None:
+        """Copy content + metadata (like shutil.copy2), keeping bytes in the kernel."""
+        FileMover._copy_nometa(source, dest)
+        shutil.copystat(source, dest)
+
+    @staticmethod
+    def _copy_nometa(source: Path, dest: Path) -> None:
+        """
+        Copy file content only (like shutil.copyfile), keeping bytes in the kernel.
+
+        Linux uses os.copy_file_range (reflink on btrfs/XFS). Everywhere else
+        shutil.copyfile already picks sendfile / fcopyfile / CopyFile2.
+        """
+        if hasattr(os, "copy_file_range"):
+            try:
+                with open(source, "rb") as fsrc, open(dest, "wb") as fdst:
+                    while os.copy_file_range(fsrc.fileno(), fdst.fileno(), 1 << 30):
+                        pass
+                return
+            except OSError as exc:
+                if exc.errno not in FileMover._COPY_RANGE_FALLBACK:
+                    raise
+        shutil.copyfile(source, dest)
+
+    _RESERVE_FLAGS = os.O_CREAT | os.O_EXCL | os.O_WRONLY
+
+    @staticmethod
+    def _reserve(path: Path) -> Path:
+        """
+        Atomically claim a free name (path, then stem_1, stem_2, ...).
+
+        The empty placeholder is created with O_EXCL, so concurrent workers
+        can never pick the same destination; callers overwrite it in place.
+        """
+        candidate = path
+        counter = 0
+        while True:
+            try:
+                os.close(os.open(candidate, FileMover._RESERVE_FLAGS, 0o666))
+                return candidate
+            except FileExistsError:
+                counter += 1
+                candidate = path.parent / f"{path.stem}_{counter}{path.suffix}"
+
     @staticmethod
     def _safe_path(path: Path) -> Path:
-        """Resolve filename collision by appending a counter suffix."""
+        """Resolve filename collision by appending a counter suffix (no side effects; DRY_RUN)."""
         if not path.exists():
             return path
         counter = 1
@@ -580,90 +976,26 @@ class DashboardUpdater:
     Silver+: [LLM_HOOK] Add AI-generated one-line summaries per task.
     """
 
-    @staticmethod
-    def update() -> bool:
-        """Rewrite Dashboard.md with live vault statistics."""
-        now = datetime.now()
-
-        inbox_files    = VaultReader.list_files(INBOX_DIR)
-        na_files       = VaultReader.list_files(NEEDS_ACTION_DIR)
-        done_files     = VaultReader.list_files(DONE_DIR)
-        plan_files     = VaultReader.list_files(PLANS_DIR, ".md")
-        pending_files  = VaultReader.list_files(PENDING_APPROVAL_DIR)
-        approved_files = VaultReader.list_files(APPROVED_DIR)
-        rejected_files = VaultReader.list_files(REJECTED_DIR)
-
-        task_files = [f for f in na_files if not f.stem.endswith("_meta")
-                      and f.suffix.lower() != ".md"]
-
-        done_today = [f for f in done_files
-                      if datetime.fromtimestamp(f.stat().st_mtime).date() == now.date()]
-
-        # ── Pending tasks table ──────────────────────────────────────────────
-        if task_files:
-            rows = []
-            for f in task_files[:15]:
-                age = int((now - datetime.fromtimestamp(f.stat().st_mtime)).total_seconds() / 60)
-                rows.append(f"| `{f.name}` | {age}m ago | Unclassified | Medium |")
-            pending_table = "\n".join(rows)
-        else:
-            pending_table = "| — | — | — | — |"
-
-        # ── Done today table ─────────────────────────────────────────────────
-        if done_today:
-            rows = []
-            for f in done_today[:15]:
-                t = datetime.fromtimestamp(f.stat().st_mtime).strftime("%H:%M")
-                rows.append(f"| `{f.name}` | {t} | ✅ Completed |")
-            done_table = "\n".join(rows)
-        else:
-            done_table = "| — | — | — |"
-
-        # ── Alerts ───────────────────────────────────────────────────────────
-        alerts = []
-        if len(task_files) > 10:
-            alerts.append(f"- ⚠️ **High load:** {len(task_files)} items awaiting action")
-        if pending_files:
-            alerts.append(f"- 🔔 **Approval needed:** {len(pending_files)} item(s) in Pending_Approval/")
-        if len(inbox_files) > 5:
-            alerts.append(f"- 📥 **Inbox filling:** {len(inbox_files)} items unprocessed")
-        alert_section = "\n".join(alerts) if alerts else "- ✅ No active alerts"
-
-        content = f"""---
-last_updated: "{now.strftime('%Y-%m-%d %H:%M:%S')}"
-system: "AI Employee - Bronze Tier"
-auto_generated: true
----
-
-# 🤖 AI Employee — Dashboard
-
-> **Last Updated:** {now.strftime('%A, %B %d, %Y at %H:%M:%S')}
-> **System:** AI Employee v{AGENT_VERSION} (Bronze Tier)
-> **Mode:** {'⚠️ DRY RUN' if DRY_RUN else '🟢 ACTIVE'}
-
+    # Static sections, built once; update() streams them around the live rows
+    _OVERVIEW_HEAD = """
 ---
 
 ## 📊 System Overview
 
 | Metric | Count |
 |--------|-------|
-| 📥 Inbox | {len(inbox_files)} |
-| ⚡ Needs Action | {len(task_files)} |
-| 📋 Plans Generated | {len(plan_files)} |
-| ⏳ Pending Approval | {len(pending_files)} |
-| ✅ Approved | {len(approved_files)} |
-| ❌ Rejected | {len(rejected_files)} |
-| ✅ Completed Today | {len(done_today)} |
-| 📁 Total Done | {len(done_files)} |
+"""
 
+    _PENDING_HEAD = """
 ---
 
 ## ⚡ Pending Tasks
 
 | File | Age | Type | Priority |
 |------|-----|------|----------|
-{pending_table}
+"""
 
+    _DONE_HEAD = """
 ---
 
 ## 🔄 In Progress
@@ -680,13 +1012,16 @@ auto_generated: true
 
 | File | Time | Status |
 |------|------|--------|
-{done_table}
+"""
 
+    _ALERTS_HEAD = """
 ---
 
 ## 🚨 Alerts
 
-{alert_section}
+"""
+
+    _STATUS_HEAD = """
 
 ---
 
@@ -700,8 +1035,9 @@ auto_generated: true
 | Plan Generator | 🟢 Online |
 | File Mover | 🟢 Online |
 | Dashboard Updater | 🟢 Online |
-| DRY_RUN Mode | {'🟡 ENABLED' if DRY_RUN else '⚫ Disabled'} |
+"""
 
+    _NAVIGATION = f"""
 ---
 
 ## 📌 Quick Navigation
@@ -720,7 +1056,206 @@ auto_generated: true
 *Auto-generated by DashboardUpdater v{AGENT_VERSION} | Bronze Tier*
 *Upgrade to Silver for AI-powered per-task summaries.*
 """
-        return VaultWriter.write(DASHBOARD_FILE, content)
+
+    @staticmethod
+    def update() -> bool:
+        """Rewrite Dashboard.md with live vault statistics."""
+        now         = datetime.now()
+        now_ts      = now.timestamp()
+        today_start = datetime.combine(now.date(), datetime.min.time()).timestamp()
+
+        # Count-only folders are never sorted; Done/ can grow to thousands of files
+        inbox_count      = VaultReader.count_files(INBOX_DIR)
+        plan_count       = VaultReader.count_files(PLANS_DIR, ".md")
+        pending_count    = VaultReader.count_files(PENDING_APPROVAL_DIR)
+        approved_count   = VaultReader.count_files(APPROVED_DIR)
+        rejected_count   = VaultReader.count_files(REJECTED_DIR)
+        done_count       = VaultReader.count_files(DONE_DIR)
+        done_today_count = VaultReader.count_files(DONE_DIR, since=today_start)
+
+        na_files   = VaultReader.list_files(NEEDS_ACTION_DIR)
+        task_files = [e for e in na_files if not e.path.stem.endswith("_meta")
+                      and e.path.suffix.lower() != ".md"
+                      and not e.path.name.startswith(".")]
+
+        # Newest 15 completions via a heap; only these rows get a datetime
+        done_recent = VaultReader.list_files(DONE_DIR, limit=15, newest_first=True)
+        done_today  = [e for e in done_recent if e.mtime >= today_start]
+
+        # ── Header + overview ────────────────────────────────────────────────
+        buf = io.StringIO()
+        buf.write(f"""---
+last_updated: "{now.strftime('%Y-%m-%d %H:%M:%S')}"
+system: "AI Employee - Bronze Tier"
+auto_generated: true
+---
+
+# 🤖 AI Employee — Dashboard
+
+> **Last Updated:** {now.strftime('%A, %B %d, %Y at %H:%M:%S')}
+> **System:** AI Employee v{AGENT_VERSION} (Bronze Tier)
+> **Mode:** {'⚠️ DRY RUN' if DRY_RUN else '🟢 ACTIVE'}
+""")
+        buf.write(DashboardUpdater._OVERVIEW_HEAD)
+        buf.write(f"| 📥 Inbox | {inbox_count} |\n")
+        buf.write(f"| ⚡ Needs Action | {len(task_files)} |\n")
+        buf.write(f"| 📋 Plans Generated | {plan_count} |\n")
+        buf.write(f"| ⏳ Pending Approval | {pending_count} |\n")
+        buf.write(f"| ✅ Approved | {approved_count} |\n")
+        buf.write(f"| ❌ Rejected | {rejected_count} |\n")
+        buf.write(f"| ✅ Completed Today | {done_today_count} |\n")
+        buf.write(f"| 📁 Total Done | {done_count} |\n")
+
+        # ── Pending tasks table ──────────────────────────────────────────────
+        buf.write(DashboardUpdater._PENDING_HEAD)
+        if task_files:
+            for e in task_files[:15]:
+                age = int((now_ts - e.mtime) / 60)
+                buf.write(f"| `{e.path.name}` | {age}m ago | Unclassified | Medium |\n")
+        else:
+            buf.write("| — | — | — | — |\n")
+
+        # ── Done today table ─────────────────────────────────────────────────
+        buf.write(DashboardUpdater._DONE_HEAD)
+        if done_today:
+            for e in done_today:
+                t = datetime.fromtimestamp(e.mtime).strftime("%H:%M")
+                buf.write(f"| `{e.path.name}` | {t} | ✅ Completed |\n")
+        else:
+            buf.write("| — | — | — |\n")
+
+        # ── Alerts ───────────────────────────────────────────────────────────
+        buf.write(DashboardUpdater._ALERTS_HEAD)
+        alerts = []
+        if len(task_files) > 10:
+            alerts.append(f"- ⚠️ **High load:** {len(task_files)} items awaiting action")
+        if pending_count:
+            alerts.append(f"- 🔔 **Approval needed:** {pending_count} item(s) in Pending_Approval/")
+        if inbox_count > 5:
+            alerts.append(f"- 📥 **Inbox filling:** {inbox_count} items unprocessed")
+        buf.write("\n".join(alerts) if alerts else "- ✅ No active alerts")
+
+        # ── System status + navigation ───────────────────────────────────────
+        buf.write(DashboardUpdater._STATUS_HEAD)
+        buf.write(f"| DRY_RUN Mode | {'🟡 ENABLED' if DRY_RUN else '⚫ Disabled'} |\n")
+        buf.write(DashboardUpdater._NAVIGATION)
+
+        return VaultWriter.write(DASHBOARD_FILE, buf.getvalue())
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# ARTIFACT INDEX
+# ──────────────────────────────────────────────────────────────────────────────
+
+class ArtifactIndex:
+    """
+    SQLite index of the files created for each task, so a rollback can unlink
+    a deleted Inbox file's artifacts directly instead of scanning folders.
+
+    tasks    : Needs_Action/ task name → Inbox source file (written by watcher.py)
+    artifacts: task name → vault-relative path of each file made for it
+               (watcher: task copy + meta card; agent: plan, moved files, copies)
+
+    Best-effort: errors are logged and callers fall back to scanning, both
+    when lookup() has nothing and when a task's indexed files are all gone
+    already (its agent-side record() never happened). WAL mode lets the
+    watcher and a standalone agent run write concurrently.
+    """
+
+    _DB_FILE = LOGS_DIR / "artifact_index.db"
+    _SCHEMA  = """
+        CREATE TABLE IF NOT EXISTS tasks (
+            task        TEXT PRIMARY KEY,
+            source_file TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS tasks_by_source ON tasks (source_file);
+        CREATE TABLE IF NOT EXISTS artifacts (
+            task TEXT NOT NULL,
+            path TEXT NOT NULL,
+            PRIMARY KEY (task, path)
+        );
+    """
+
+    _conn: Optional[sqlite3.Connection] = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def record(cls, task: str, paths: list[Path], source_file: str = None) -> bool:
+        """Index paths as artifacts of task (and, from the watcher, its Inbox source)."""
+        if DRY_RUN:
+            return True
+        rows = [(task, path.relative_to(VAULT_ROOT).as_posix()) for path in paths]
+        try:
+            with cls._lock:
+                conn = cls._connect()
+                with conn:
+                    if source_file is not None:
+                        conn.execute(
+                            "INSERT OR REPLACE INTO tasks (task, source_file) VALUES (?, ?)",
+                            (task, source_file),
+                        )
+                    conn.executemany(
+                        "INSERT OR IGNORE INTO artifacts (task, path) VALUES (?, ?)", rows
+                    )
+            return True
+        except Exception as exc:
+            logger.error(f"ArtifactIndex.record({task}): {exc}")
+            return False
+
+    @classmethod
+    def lookup(cls, source_file: str) -> Optional[dict[str, list[Path]]]:
+        """Return {task name: [artifact paths]} for an Inbox file; None on error."""
+        try:
+            with cls._lock:
+                rows = cls._connect().execute(
+                    "SELECT t.task, a.path FROM tasks t "
+                    "LEFT JOIN artifacts a ON a.task = t.task WHERE t.source_file = ?",
+                    (source_file,),
+                ).fetchall()
+        except Exception as exc:
+            logger.error(f"ArtifactIndex.lookup({source_file}): {exc}")
+            return None
+        found: dict[str, list[Path]] = {}
+        for task, path in rows:
+            paths = found.setdefault(task, [])
+            if path is not None:
+                paths.append(VAULT_ROOT / path)
+        return found
+
+    @classmethod
+    def forget(cls, tasks: list[str]) -> None:
+        """Drop index rows for tasks whose artifacts have been removed."""
+        if DRY_RUN or not tasks:
+            return
+        try:
+            with cls._lock:
+                conn = cls._connect()
+                with conn:
+                    conn.executemany("DELETE FROM artifacts WHERE task = ?", [(t,) for t in tasks])
+                    conn.executemany("DELETE FROM tasks WHERE task = ?", [(t,) for t in tasks])
+        except Exception as exc:
+            logger.error(f"ArtifactIndex.forget({len(tasks)} task(s)): {exc}")
+
+    @classmethod
+    def close(cls) -> None:
+        with cls._lock:
+            if cls._conn is not None:
+                cls._conn.close()
+                cls._conn = None
+
+    @classmethod
+    def _connect(cls) -> sqlite3.Connection:
+        """Open (once) the shared connection; caller holds _lock."""
+        if cls._conn is None:
+            conn = sqlite3.connect(cls._DB_FILE, timeout=10, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(cls._SCHEMA)
+            cls._conn = conn
+        return cls._conn
+
+
+atexit.register(ArtifactIndex.close)
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -735,17 +1270,28 @@ class ActionProcessor:
     Pipeline per task:
       classify → generate_plan → route (approval | execute) → move_to_done → update_dashboard
 
+    Tasks are independent and I/O-bound, so they run on a thread pool;
+    the dashboard is rewritten once, by the driver, after the pool drains.
+
     Bronze  : Rule-based classify + execute (safe catalog-only actions).
     Silver+ : [LLM_HOOK] Replace execute step with LLM-driven real actions.
     [RW_HOOK]: Gold tier Ralph Wiggum continuous loop wraps this class.
     """
 
+    # One reusable encoder for catalog lines: compact separators, no per-call setup
+    _CATALOG_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
     @staticmethod
-    def run() -> dict:
-        """Process all pending tasks. Returns a results summary dict."""
+    def run(workers: int = None) -> dict:
+        """
+        Process all pending tasks. Returns a results summary dict.
+
+        workers: thread-pool size (default: os.cpu_count()).
+        """
+        run_start = datetime.now()
         logger.info("═" * 62)
         logger.info(f"  ClaudeAgent v{AGENT_VERSION} — Bronze Tier")
-        logger.info(f"  Run started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        logger.info(f"  Run started: {run_start.strftime('%Y-%m-%d %H:%M:%S')}")
         if DRY_RUN:
             logger.info("  *** DRY_RUN MODE — No changes will be made ***")
         logger.info("═" * 62)
@@ -766,13 +1312,20 @@ class ActionProcessor:
 
         logger.info(f"Found {len(tasks)} task(s) in Needs_Action/")
 
-        for task in tasks:
-            try:
-                ActionProcessor._process_one(task, results)
-            except Exception as exc:
-                logger.error(f"Error on {task['name']}: {exc}", exc_info=True)
-                results["errors"] += 1
-
+        workers = max(1, min(workers or os.cpu_count() or 1, len(tasks)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="task") as pool:
+            futures = {pool.submit(ActionProcessor._process_one, t, run_start): t for t in tasks}
+            for future in as_completed(futures):
+                task = futures[future]
+                try:
+                    for key, count in future.result().items():
+                        results[key] += count
+                except Exception as exc:
+                    logger.error(f"Error on {task.name}: {exc}", exc_info=True)
+                    results["errors"] += 1
+
+        # Catalog entries are durable once the run reports complete
+        VaultWriter.flush_appends(sync=True)
         DashboardUpdater.update()
         logger.info("═" * 62)
         logger.info(f"  Run complete: {results}")
@@ -782,62 +1335,78 @@ class ActionProcessor:
     # ── private ─────────────────────────────────────────────────────────────
 
     @staticmethod
-    def _process_one(task: dict, results: dict):
-        logger.info(f"▶ Processing: {task['name']}")
+    def _process_one(task: TaskDescriptor, run_start: datetime = None) -> dict:
+        """
+        Run the pipeline for one task; returns its counts for the run summary.
+
+        run_start: shared clock reading for plan timestamps and file prefixes.
+        """
+        run_start = run_start or datetime.now()
+        logger.info(f"▶ Processing: {task.name}")
+        results = {"processed": 0, "plans_created": 0, "completed": 0, "routed_for_approval": 0}
 
-        # Step 1 — Classify
-        ct = TaskClassifier.classify(task)
+        # Step 1 — Classify (fills the task's classification fields in place)
+        TaskClassifier.classify(task)
         logger.info(
-            f"  type={ct['task_type']}  priority={ct['priority']}  "
-            f"action={ct['action']}  approval={ct['requires_approval']}"
+            f"  type={task.task_type}  priority={task.priority}  "
+            f"action={task.action}  approval={task.requires_approval}"
         )
 
         # Step 2 — Generate plan
-        plan_content = PlanGenerator.generate(ct)
-        ts           = datetime.now().strftime("%Y%m%d_%H%M%S")
-        plan_name    = f"{ts}_{task['stem']}_plan.md"
-        plan_path    = PLANS_DIR / plan_name
-
-        PLANS_DIR.mkdir(parents=True, exist_ok=True)
-        if VaultWriter.write(plan_path, plan_content):
+        plan_parts   = PlanGenerator.generate_parts(task, now=run_start)
+        ts           = run_start.strftime("%Y%m%d_%H%M%S")
+        # Same-stem tasks (X_report.pdf + X_report.docx) share ts within a run;
+        # claiming the name keeps parallel workers off each other's plan file
+        plan_path    = FileMover.claim(PLANS_DIR / f"{ts}_{task.stem}_plan.md")
+
+        artifacts: list[Path] = []   # Everything made for this task, for ArtifactIndex
+        if plan_path and VaultWriter.write_parts(plan_path, plan_parts):
             results["plans_created"] += 1
-            logger.info(f"  ✔ Plan → Plans/{plan_name}")
+            artifacts.append(plan_path)
+            logger.info(f"  ✔ Plan → Plans/{plan_path.name}")
+        elif plan_path and not DRY_RUN:
+            plan_path.unlink(missing_ok=True)   # Drop the empty reservation
 
         # Step 3 — Route
-        if ct["requires_approval"]:
+        if task.requires_approval:
             # Move task file + metadata to Pending_Approval; copy plan there too.
             # This clears the queue — human reviews in Pending_Approval/.
-            FileMover.move(task["task_file"], PENDING_APPROVAL_DIR,
-                           f"{ts}_{task['name']}")
-            if task.get("meta_file") and task["meta_file"].exists():
-                FileMover.move(task["meta_file"], PENDING_APPROVAL_DIR,
-                               f"{ts}_{task['meta_file'].name}")
-            FileMover.copy_to(plan_path, PENDING_APPROVAL_DIR)
+            artifacts.append(FileMover.move(task.task_file, PENDING_APPROVAL_DIR,
+                                            f"{ts}_{task.name}"))
+            if task.meta_file and task.meta_file.exists():
+                artifacts.append(FileMover.move(task.meta_file, PENDING_APPROVAL_DIR,
+                                                f"{ts}_{task.meta_file.name}"))
+            if plan_path:
+                artifacts.append(FileMover.copy_to(plan_path, PENDING_APPROVAL_DIR))
             logger.info(f"  ⏳ Routed to Pending_Approval/ (approval required)")
             results["routed_for_approval"] += 1
         else:
             # Step 4 — Execute safe Bronze-tier actions
-            ActionProcessor._execute(ct)
+            ActionProcessor._execute(task)
 
             # Step 5 — Move task file to Done/
-            done_name = f"{ts}_{task['name']}"
-            dest = FileMover.move(task["task_file"], DONE_DIR, done_name)
+            done_name = f"{ts}_{task.name}"
+            dest = FileMover.move(task.task_file, DONE_DIR, done_name)
             if dest:
                 results["completed"] += 1
+                artifacts.append(dest)
                 logger.info(f"  ✔ Done → Done/{done_name}")
 
             # Move metadata alongside it
-            if task.get("meta_file") and task["meta_file"].exists():
-                FileMover.move(
-                    task["meta_file"], DONE_DIR,
-                    f"{ts}_{task['meta_file'].name}"
-                )
+            if task.meta_file and task.meta_file.exists():
+                artifacts.append(FileMover.move(
+                    task.meta_file, DONE_DIR,
+                    f"{ts}_{task.meta_file.name}"
+                ))
+
+        ArtifactIndex.record(task.name, [p for p in artifacts if p])
 
         results["processed"] += 1
-        logger.info(f"  ✅ {task['name']} complete")
+        logger.info(f"  ✅ {task.name} complete")
+        return results
 
     @staticmethod
-    def _execute(task: dict):
+    def _execute(task: TaskDescriptor):
         """
         Execute safe, non-destructive Bronze-tier actions.
 
@@ -849,27 +1418,24 @@ class ActionProcessor:
         #   - Query internal knowledge base
         #   - Populate spreadsheet templates
         """
-        logger.info(f"  ⚙ Executing: {task.get('action')} on {task.get('task_type')} file")
+        logger.info(f"  ⚙ Executing: {task.action} on {task.task_type} file")
 
         entry = {
             "timestamp"  : datetime.now().isoformat(),
-            "file"       : task["name"],
-            "type"       : task.get("task_type"),
-            "action"     : task.get("action"),
-            "priority"   : task.get("priority"),
+            "file"       : task.name,
+            "type"       : task.task_type,
+            "action"     : task.action,
+            "priority"   : task.priority,
             "tier"       : TIER,
             "status"     : "completed",
             "dry_run"    : DRY_RUN,
         }
 
         if not DRY_RUN:
-            try:
-                LOGS_DIR.mkdir(parents=True, exist_ok=True)
-                with open(CATALOG_FILE, "a", encoding="utf-8") as fh:
-                    fh.write(json.dumps(entry) + "\n")
+            if VaultWriter.append(CATALOG_FILE, ActionProcessor._CATALOG_ENCODER.encode(entry) + "\n"):
                 logger.debug(f"  Catalog entry written")
-            except Exception as exc:
-                logger.warning(f"  Catalog write failed: {exc}")
+            else:
+                logger.warning(f"  Catalog write failed")
         else:
             logger.info(f"  [DRY_RUN] Catalog entry: {entry}")
 
@@ -889,6 +1455,7 @@ Examples:
   python claude_agent.py --dry-run          Simulate; no changes
   python claude_agent.py --update-dashboard Refresh Dashboard.md only
   python claude_agent.py --scan             List tasks in Needs_Action/
+  python claude_agent.py --workers 4        Process up to 4 tasks concurrently
 
 Environment variables:
   DRY_RUN=true    Enable dry-run mode
@@ -900,6 +1467,8 @@ Environment variables:
                    help="Only refresh Dashboard.md; skip task processing")
     p.add_argument("--scan",              action="store_true",
                    help="List pending tasks without processing them")
+    p.add_argument("--workers",           type=int, default=None, metavar="N",
+                   help="Number of tasks to process concurrently (default: CPU count)")
     return p
 
 
@@ -917,7 +1486,7 @@ def main():
         tasks = VaultReader.scan_needs_action()
         print(f"\nPending tasks in Needs_Action/ ({len(tasks)} found):")
         for t in tasks:
-            print(f"  • {t['name']}  [{t['size']:,} bytes | {t['modified'].strftime('%H:%M:%S')}]")
+            print(f"  • {t.name}  [{t.size:,} bytes | {t.modified.strftime('%H:%M:%S')}]")
         print()
         return
 
@@ -927,7 +1496,7 @@ def main():
         logger.info("Dashboard updated.")
         return
 
-    results = ActionProcessor.run()
+    results = ActionProcessor.run(workers=args.workers)
 
     print(f"\n{'─'*50}")
     print(f"  Run Summary")
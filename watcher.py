@@ -24,12 +24,19 @@ import os
 import sys
 import re
 import json
+import mmap
 import shutil
 import logging
 import hashlib
+import functools
 import time
+import queue
 import signal
+import atexit
+import threading
+import tempfile
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
@@ -50,13 +57,21 @@ if sys.platform == "win32":
 
 try:
     from watchdog.observers import Observer
-    from watchdog.events import FileSystemEventHandler
+    from watchdog.events import (
+        FileCreatedEvent, FileDeletedEvent, FileModifiedEvent, FileSystemEventHandler,
+    )
 except ImportError:
     print("ERROR: watchdog library not installed.")
     print("Run:   pip install watchdog")
     print("Or:    pip install -r requirements.txt")
     sys.exit(1)
 
+# Optional: BLAKE3 (SIMD) for file hashes; SHA-256 from hashlib otherwise
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
 # ──────────────────────────────────────────────────────────────────────────────
 # CONFIGURATION
 # ──────────────────────────────────────────────────────────────────────────────
@@ -75,13 +90,34 @@ DASHBOARD_FILE       = VAULT_ROOT / "Dashboard.md"
 WATCHER_VERSION = "1.0.0"
 TIER            = "bronze"
 
+# Task-card file hashes are tagged with the algorithm that produced them
+HASH_ALGORITHM = "blake3" if blake3 else "sha256"
+
 # Set DRY_RUN=true in environment to simulate without making any changes
 DRY_RUN = os.environ.get("DRY_RUN", "false").lower() in ("true", "1", "yes")
 
 # How long to wait (seconds) for a file to stabilise before copying
+# A file counts as stable once it has had no modified events for
+# FILE_STABILISE_INTERVAL and its size is unchanged across that quiet window
 FILE_STABILISE_TIMEOUT = 30
 FILE_STABILISE_INTERVAL = 0.5
 
+# Dashboard refreshes requested within this window (seconds) collapse into one
+DASHBOARD_DEBOUNCE_SECONDS = 0.5
+
+# Tombstoned (blank) catalog lines are compacted away once they exceed this
+# share of task_catalog.jsonl's bytes
+CATALOG_COMPACT_RATIO = 0.25
+
+# Agent runs are batched: new files queue up until arrivals pause for this long
+# (seconds) or this many are waiting, then one run processes all of them
+AGENT_BATCH_SECONDS = 0.25
+AGENT_BATCH_SIZE    = 32
+
+# New Inbox files are stabilised, copied and hashed on this many worker threads
+# so a large file never holds up the observer or the files behind it
+INGEST_WORKERS = 4
+
 # ──────────────────────────────────────────────────────────────────────────────
 # LOGGING
 # ──────────────────────────────────────────────────────────────────────────────
@@ -104,54 +140,91 @@ logger = logging.getLogger("VaultWatcher")
 # HELPERS
 # ──────────────────────────────────────────────────────────────────────────────
 
-def compute_md5(filepath: Path) -> str:
-    """Return MD5 hex digest of a file for integrity verification."""
-    h = hashlib.md5()
+_COPY_BUFSIZE = 1 << 20   # 1 MiB: hashing/copy loops cross into C once per MiB
+
+
+def _new_hasher():
+    """Incremental hasher for HASH_ALGORITHM."""
+    return blake3.blake3() if blake3 else hashlib.sha256()
+
+
+def compute_file_hash(filepath: Path) -> str:
+    """Return "<algorithm>:<hex digest>" of a file for integrity verification."""
     try:
-        with open(filepath, "rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                h.update(chunk)
-        return h.hexdigest()
+        if blake3:
+            h = blake3.blake3()
+            h.update_mmap(filepath)
+        else:
+            with open(filepath, "rb") as f:
+                if hasattr(hashlib, "file_digest"):   # 3.11+: C loop, GIL released
+                    h = hashlib.file_digest(f, "sha256")
+                else:
+                    h = hashlib.sha256()
+                    for chunk in iter(lambda: f.read(_COPY_BUFSIZE), b""):
+                        h.update(chunk)
+        return f"{HASH_ALGORITHM}:{h.hexdigest()}"
     except Exception as exc:
         logger.warning(f"Cannot compute hash for {filepath.name}: {exc}")
         return "unknown"
 
 
+def _copy_and_hash(src: Path, dst: Path) -> str:
+    """
+    Copy src to dst (content + metadata, like shutil.copy2) and return the
+    "<algorithm>:<hex digest>" of the bytes copied — one read of the source
+    instead of two.
+    """
+    h    = _new_hasher()
+    buf  = bytearray(_COPY_BUFSIZE)   # Reused for every chunk: no per-read allocation
+    view = memoryview(buf)
+    with open(src, "rb", buffering=0) as fsrc, open(dst, "wb") as fdst:
+        while n := fsrc.readinto(buf):
+            h.update(view[:n])
+            fdst.write(view[:n])
+    shutil.copystat(src, dst)
+    return f"{HASH_ALGORITHM}:{h.hexdigest()}"
+
+
+_SANITIZE_TABLE = str.maketrans({ch: "_" for ch in r'\/:*?"<>|'})
+
+
 def sanitize_filename(name: str) -> str:
     """Strip filesystem-unsafe characters from a filename stem."""
-    for ch in r'\/:*?"<>|':
-        name = name.replace(ch, "_")
-    return name
+    return name.translate(_SANITIZE_TABLE)
 
 
-def generate_metadata_md(source_file: Path, dest_file: Path) -> str:
+def generate_metadata_md(source_file: Path, dest_file: Path, fhash: str | None = None,
+                         now: datetime | None = None, size: int | None = None) -> str:
     """
     Build a YAML-frontmatter Markdown task card for a newly detected file.
 
     This metadata file is the handoff document between the Watcher (Perception)
     and the Claude Agent (Reasoning). It contains all context the agent needs.
+    fhash: digest already computed during the copy; hashed from source if omitted.
+    now:   detection time (the one used for the destination name); defaults to now.
+    size:  byte count already measured on the copy; stats the source if omitted.
     """
-    now   = datetime.now()
-    stat  = source_file.stat()
-    fhash = compute_md5(source_file)
+    now_str = (now or datetime.now()).strftime('%Y-%m-%d %H:%M:%S')
+    size    = source_file.stat().st_size if size is None else size
+    fhash   = fhash or compute_file_hash(source_file)
 
     return f"""---
 title: "Task: {source_file.name}"
-created: "{now.strftime('%Y-%m-%d %H:%M:%S')}"
+created: "{now_str}"
 source_file: "{source_file.name}"
 source_path: "{source_file.as_posix()}"
 destination_path: "{dest_file.as_posix()}"
 status: "needs_action"
 priority: "unset"
-file_size_bytes: {stat.st_size}
-file_hash_md5: "{fhash}"
+file_size_bytes: {size}
+file_hash: "{fhash}"
 watcher_version: "{WATCHER_VERSION}"
 tier: "{TIER}"
 ---
 
 # Task: {source_file.name}
 
-**Received:** {now.strftime('%Y-%m-%d %H:%M:%S')}
+**Received:** {now_str}
 **Status:** Needs Action
 **Priority:** Unset (pending classification)
 
@@ -161,9 +234,9 @@ tier: "{TIER}"
 |-------|-------|
 | Filename | `{source_file.name}` |
 | Destination | `{dest_file.name}` |
-| Size | {stat.st_size:,} bytes |
-| MD5 Hash | `{fhash}` |
-| Detected At | {now.strftime('%Y-%m-%d %H:%M:%S')} |
+| Size | {size:,} bytes |
+| File Hash | `{fhash}` |
+| Detected At | {now_str} |
 
 ## Processing Checklist
 
@@ -189,56 +262,197 @@ tier: "{TIER}"
 """
 
 
-def _read_source_file_from_meta(meta_path: Path) -> str | None:
-    """Read meta file and return source_file from YAML frontmatter, or None."""
+_BLANK_LINE_RE = re.compile(rb"^ +$", re.MULTILINE)   # A tombstoned catalog line
+
+# source_file precedes destination_path in every card generate_metadata_md() writes
+_META_RE = re.compile(
+    r'source_file:\s*"([^"]+)"(?:[\s\S]*?destination_path:\s*"([^"]+)")?'
+)
+
+
+def _read_frontmatter(f) -> str:
+    """
+    Return the YAML frontmatter of an open card, stopping at its closing '---'
+    so the Markdown body is never decoded or searched. Files without
+    frontmatter are returned whole.
+    """
+    first = f.readline()
+    if first.strip() != "---":
+        return first + f.read()
+    lines = []
+    for line in f:
+        if line.strip() == "---":
+            break
+        lines.append(line)
+    return "".join(lines)
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_meta_fields(meta_path: str, mtime_ns: int) -> tuple[str | None, str | None]:
+    """Read a meta file once; cached per (path, mtime) so unchanged cards are never re-read."""
     try:
-        text = meta_path.read_text(encoding="utf-8")
-        m = re.search(r'source_file:\s*"([^"]+)"', text)
-        return m.group(1) if m else None
+        with open(meta_path, encoding="utf-8") as f:
+            m = _META_RE.search(_read_frontmatter(f))
     except Exception:
-        return None
+        return None, None
+    return (m.group(1), m.group(2)) if m else (None, None)
+
 
+def _read_meta_fields(meta_path: Path, mtime_ns: int | None = None) -> tuple[str | None, str | None]:
+    """
+    Return (source_file, destination_path) from a meta file's frontmatter; None if absent.
+    mtime_ns: pass it when a directory scan already has it, to skip the stat().
+    """
+    if mtime_ns is None:
+        try:
+            mtime_ns = meta_path.stat().st_mtime_ns
+        except OSError:
+            return None, None
+    return _parse_meta_fields(str(meta_path), mtime_ns)
 
-def _read_destination_path_from_meta(meta_path: Path) -> str | None:
-    """Read meta file and return destination_path from YAML frontmatter, or None."""
+
+def _scan_files(directory: Path) -> list[os.DirEntry]:
+    """One os.scandir pass over a vault folder: its files, or [] if it does not exist."""
     try:
-        text = meta_path.read_text(encoding="utf-8")
-        m = re.search(r'destination_path:\s*"([^"]+)"', text)
-        return m.group(1) if m else None
-    except Exception:
-        return None
+        with os.scandir(directory) as it:
+            return [entry for entry in it if entry.is_file()]
+    except FileNotFoundError:
+        return []
+
+
+def _iter_meta(entries: list[os.DirEntry]):
+    """Yield (path, mtime_ns) for each *_meta.md among scanned entries."""
+    for entry in entries:
+        if entry.name.endswith("_meta.md"):
+            try:
+                yield Path(entry.path), entry.stat().st_mtime_ns
+            except OSError:
+                continue   # Removed since the scan
+
+
+class DashboardDebouncer:
+    """
+    Collapses bursts of refresh requests into a single call.
+
+    Each request() (re)arms a timer; the action runs once the requests have
+    been quiet for `delay` seconds. flush() runs a pending action immediately
+    (used at shutdown so the last refresh is never lost).
+    """
+
+    def __init__(self, action, delay: float):
+        self._action = action
+        self._delay  = delay
+        self._lock   = threading.Lock()
+        self._timer: threading.Timer | None = None   # Non-None ⇔ refresh pending
+
+    def request(self) -> None:
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(self._delay, self._fire)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self) -> None:
+        with self._lock:
+            timer, self._timer = self._timer, None
+        if timer is not None:
+            timer.cancel()
+            self._action()
+
+    def _fire(self) -> None:
+        with self._lock:
+            self._timer = None
+        self._action()
 
 
 def refresh_dashboard() -> None:
-    """Run claude_agent.py --update-dashboard to refresh Dashboard.md with current vault state."""
+    """Request a Dashboard.md refresh; bursts within DASHBOARD_DEBOUNCE_SECONDS run once."""
+    _dashboard_debouncer.request()
+
+
+_agent_module = None
+_agent_import_failed = False
+
+# Held by agent runs, ingest commits, rollbacks and dashboard refreshes so
+# they never interleave
+_vault_lock = threading.RLock()
+
+
+def _load_agent():
+    """
+    Import claude_agent on first use so the agent runs in-process, without a
+    Python start-up per call. The import is deferred until after this module's
+    logging is configured, so the agent attaches to it (its records still land
+    in agent.log). Returns None if the import fails; callers then fall back to
+    running claude_agent.py as a subprocess.
+    """
+    global _agent_module, _agent_import_failed
+    if _agent_module is None and not _agent_import_failed:
+        try:
+            import claude_agent
+            _agent_module = claude_agent
+        except Exception as exc:
+            _agent_import_failed = True
+            logger.warning(f"  In-process agent unavailable ({exc}); using subprocess")
+    return _agent_module
+
+
+def _run_agent_subprocess(*args: str, timeout: int) -> subprocess.CompletedProcess:
+    """Fallback: run claude_agent.py in a child interpreter."""
+    return subprocess.run(
+        [sys.executable, Path(__file__).parent / "claude_agent.py", *args],
+        cwd=Path(__file__).parent,
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+    )
+
+
+def _do_refresh_dashboard() -> None:
+    """Regenerate Dashboard.md from the current vault state via DashboardUpdater."""
     if DRY_RUN:
         logger.info("  [DRY_RUN] Would refresh Dashboard")
         return
     try:
-        subprocess.run(
-            [sys.executable, Path(__file__).parent / "claude_agent.py", "--update-dashboard"],
-            cwd=Path(__file__).parent,
-            capture_output=True,
-            timeout=30,
-        )
+        agent = _load_agent()
+        # Runs on the debounce timer thread: without the lock it could
+        # overwrite Dashboard.md while an agent run is writing it too
+        with _vault_lock:
+            if agent is not None:
+                agent.DashboardUpdater.update()
+            else:
+                _run_agent_subprocess("--update-dashboard", timeout=30)
         logger.info("  ✔ Dashboard updated")
     except Exception as exc:
         logger.warning(f"  ✘ Dashboard update failed: {exc}")
 
 
+_dashboard_debouncer = DashboardDebouncer(_do_refresh_dashboard, DASHBOARD_DEBOUNCE_SECONDS)
+atexit.register(_dashboard_debouncer.flush)
+
+
 def run_agent() -> None:
-    """Run claude_agent.py to process all pending tasks in Needs_Action/."""
+    """Run the Claude agent over all pending tasks in Needs_Action/."""
     if DRY_RUN:
         logger.info("  [DRY_RUN] Would run Claude agent")
         return
+
+    agent = _load_agent()
+    if agent is not None:
+        try:
+            with _vault_lock:
+                agent.ActionProcessor.run()
+            logger.info("  ✔ Claude agent run complete")
+        except Exception as exc:
+            logger.warning(f"  ✘ Claude agent run failed: {exc}")
+        finally:
+            # Release the catalog handle so rollback can swap task_catalog.jsonl
+            agent.VaultWriter.close_appends()
+        return
+
     try:
-        result = subprocess.run(
-            [sys.executable, Path(__file__).parent / "claude_agent.py"],
-            cwd=Path(__file__).parent,
-            capture_output=True,
-            text=True,
-            timeout=120,
-        )
+        result = _run_agent_subprocess(timeout=120)
         if result.returncode == 0:
             logger.info("  ✔ Claude agent run complete")
         else:
@@ -251,94 +465,189 @@ def run_agent() -> None:
         logger.warning(f"  ✘ Claude agent run failed: {exc}")
 
 
+def _filter_catalog(removed_stems: frozenset[str]) -> None:
+    """
+    Drop task_catalog.jsonl entries whose "file" stem is in removed_stems.
+
+    Matching lines are tombstoned in place through mmap — overwritten with
+    spaces, which JSONL readers skip as blank lines — so a delete costs a few
+    page writes instead of a rewrite, and an agent's open append handle stays
+    valid. Only lines containing one of the stems (as JSON encodes it) are
+    parsed. Once blank bytes pass CATALOG_COMPACT_RATIO of the file,
+    _compact_catalog() rewrites it without them.
+    """
+    needles = re.compile(
+        "|".join(re.escape(json.dumps(stem)[1:-1]) for stem in removed_stems).encode()
+    )
+    try:
+        with open(CATALOG_FILE, "r+b") as f:
+            size = os.fstat(f.fileno()).st_size
+            if not size:
+                return
+            with mmap.mmap(f.fileno(), 0) as mm:
+                line_end = -1
+                for m in needles.finditer(mm):
+                    if m.start() < line_end:
+                        continue   # Another hit on a line already handled
+                    start    = mm.rfind(b"\n", 0, m.start()) + 1
+                    line_end = mm.find(b"\n", m.end())
+                    if line_end == -1:
+                        line_end = size
+                    try:
+                        file_val = json.loads(mm[start:line_end]).get("file", "")
+                    except ValueError:
+                        continue
+                    if Path(file_val).stem in removed_stems:
+                        mm[start:line_end] = b" " * (line_end - start)
+                        logger.info(f"  ✔ Removed catalog entry: {file_val}")
+                blank = sum(m.end() - m.start() for m in _BLANK_LINE_RE.finditer(mm))
+                mm.flush()
+    except Exception as exc:
+        logger.warning(f"  ✘ Could not update task_catalog.jsonl: {exc}")
+        return
+
+    if blank > size * CATALOG_COMPACT_RATIO:
+        _compact_catalog()
+
+
+def _compact_catalog() -> None:
+    """
+    Rewrite task_catalog.jsonl without blank (tombstoned) lines.
+
+    Streams line by line into a temp file beside the catalog, then swaps it in
+    with os.replace — constant memory, and readers never see a half-written file.
+    """
+    tmp_path = None
+    try:
+        with open(CATALOG_FILE, "r", encoding="utf-8", buffering=1 << 20) as src, \
+             tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=LOGS_DIR,
+                                         prefix=".task_catalog.", suffix=".tmp",
+                                         delete=False) as dst:
+            tmp_path = dst.name
+            for line in src:
+                if line.strip():
+                    dst.write(line if line.endswith("\n") else line + "\n")
+        os.replace(tmp_path, CATALOG_FILE)
+        logger.info("  ✔ Compacted task_catalog.jsonl")
+    except Exception as exc:
+        logger.warning(f"  ✘ Could not compact task_catalog.jsonl: {exc}")
+        if tmp_path and os.path.exists(tmp_path):
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+
+def _safe_unlink(p: Path) -> bool:
+    try:
+        p.unlink()
+        logger.info(f"  ✔ Removed {p.relative_to(VAULT_ROOT)}")
+        return True
+    except FileNotFoundError:
+        pass
+    except Exception as exc:
+        logger.warning(f"  ✘ Could not remove {p.name}: {exc}")
+    return False
+
+
+def _invalidate_listings(*directories: Path) -> None:
+    """Drop the in-process agent's cached listings for folders the watcher just changed."""
+    agent = _load_agent()
+    if agent is not None:
+        for directory in directories:
+            agent.VaultReader.invalidate(directory)
+
+
+def _rollback_indexed(deleted_name: str) -> set[str] | None:
+    """
+    Fast path: unlink the artifacts ArtifactIndex recorded for deleted_name.
+    Returns the removed Needs_Action stems, or None if the index has nothing
+    for this file (ingested before the index existed, or index unavailable).
+
+    A task none of whose indexed files still existed was moved on by an agent
+    run whose record() never landed (failed write, agent killed), so its real
+    artifacts are unknown; those are found by scanning the meta cards.
+    """
+    agent = _load_agent()
+    indexed = agent.ArtifactIndex.lookup(deleted_name) if agent is not None else None
+    if not indexed:
+        return None
+    incomplete = False
+    for paths in indexed.values():
+        removed = [_safe_unlink(path) for path in paths]
+        incomplete |= not any(removed)
+    agent.ArtifactIndex.forget(list(indexed))
+    removed_na_stems = {Path(task).stem for task in indexed}
+    if incomplete:
+        removed_na_stems |= _rollback_scan(deleted_name)
+    return removed_na_stems
+
+
+def _rollback_scan_routed(directory: Path, deleted_name: str, plan_dirs: tuple[Path, ...],
+                          removed_na_stems: set[str]) -> None:
+    """Remove deleted_name's task + meta cards from a routed folder (Done/Pending_Approval) and their plans."""
+    entries = _scan_files(directory)
+    for meta_path, mtime_ns in _iter_meta(entries):
+        source_name, dest_path_str = _read_meta_fields(meta_path, mtime_ns)
+        if source_name != deleted_name:
+            continue
+        if dest_path_str:
+            removed_na_stems.add(Path(dest_path_str).stem)
+        stem = meta_path.stem.replace("_meta", "")
+        _safe_unlink(meta_path)
+        for entry in entries:
+            if entry.name.startswith(f"{stem}.") and not entry.name.lower().endswith(".md"):
+                _safe_unlink(Path(entry.path))
+        for plan_dir in plan_dirs:
+            _safe_unlink(plan_dir / f"{stem}_plan.md")
+
+
+def _rollback_scan(deleted_name: str) -> set[str]:
+    """Fallback: find deleted_name's artifacts by reading every meta card once. Returns removed stems."""
+    removed_na_stems: set[str] = set()  # needs_action file stems for catalog filter
+
+    # ── Needs_Action: meta files with matching source_file ────────────────────
+    for meta_path, mtime_ns in _iter_meta(_scan_files(NEEDS_ACTION_DIR)):
+        source_name, dest_path_str = _read_meta_fields(meta_path, mtime_ns)
+        if source_name != deleted_name:
+            continue
+        if dest_path_str:
+            dest_path = Path(dest_path_str)
+            removed_na_stems.add(dest_path.stem)
+            _safe_unlink(NEEDS_ACTION_DIR / dest_path.name)
+        _safe_unlink(meta_path)
+
+    # ── Done: remove meta, task, and plan ─────────────────────────────────────
+    _rollback_scan_routed(DONE_DIR, deleted_name, (PLANS_DIR,), removed_na_stems)
+
+    # ── Pending_Approval: same as Done, plus the plan copy routed alongside ───
+    _rollback_scan_routed(PENDING_APPROVAL_DIR, deleted_name,
+                          (PENDING_APPROVAL_DIR, PLANS_DIR), removed_na_stems)
+
+    return removed_na_stems
+
+
 def rollback_for_deleted_inbox_file(deleted_inbox_name: str) -> None:
     """
     When an Inbox file is deleted, remove all vault artifacts that were created for it:
     Needs_Action (task + meta), Done (task + meta), Plans, Pending_Approval (task + meta + plan),
     and matching task_catalog.jsonl entries. Then refresh Dashboard.
+
+    Artifacts are looked up in the ArtifactIndex first; files ingested before
+    the index existed are found by scanning the meta cards instead.
     """
-    deleted_name = deleted_inbox_name
-    removed_na_stems: set[str] = set()  # needs_action file stems for catalog filter
+    # Serialised with agent runs and ingests: none of them sees a half-removed task
+    with _vault_lock:
+        removed_na_stems = _rollback_indexed(deleted_inbox_name)
+        if removed_na_stems is None:
+            removed_na_stems = _rollback_scan(deleted_inbox_name)
 
-    def safe_unlink(p: Path) -> bool:
-        if p.exists():
-            try:
-                p.unlink()
-                logger.info(f"  ✔ Removed {p.relative_to(VAULT_ROOT)}")
-                return True
-            except Exception as exc:
-                logger.warning(f"  ✘ Could not remove {p.name}: {exc}")
-        return False
+        # Directory mtimes can miss these unlinks on coarse-timestamp filesystems
+        _invalidate_listings(NEEDS_ACTION_DIR, DONE_DIR, PLANS_DIR, PENDING_APPROVAL_DIR)
 
-    # ── Needs_Action: meta files with matching source_file ────────────────────
-    if NEEDS_ACTION_DIR.exists():
-        for meta_path in NEEDS_ACTION_DIR.glob("*_meta.md"):
-            if _read_source_file_from_meta(meta_path) != deleted_name:
-                continue
-            dest_path_str = _read_destination_path_from_meta(meta_path)
-            if dest_path_str:
-                na_name = Path(dest_path_str).name
-                na_stem = Path(dest_path_str).stem
-                removed_na_stems.add(na_stem)
-                task_path = NEEDS_ACTION_DIR / na_name
-                safe_unlink(task_path)
-            safe_unlink(meta_path)
-
-    # ── Done: meta files with matching source_file → remove meta, task, and plan ─
-    if DONE_DIR.exists():
-        for meta_path in DONE_DIR.glob("*_meta.md"):
-            if _read_source_file_from_meta(meta_path) != deleted_name:
-                continue
-            dest_path_str = _read_destination_path_from_meta(meta_path)
-            if dest_path_str:
-                removed_na_stems.add(Path(dest_path_str).stem)
-            stem = meta_path.stem.replace("_meta", "")
-            safe_unlink(meta_path)
-            for task_path in DONE_DIR.glob(f"{stem}.*"):
-                if task_path.suffix.lower() != ".md":
-                    safe_unlink(task_path)
-            plan_path = PLANS_DIR / f"{stem}_plan.md"
-            safe_unlink(plan_path)
-
-    # ── Pending_Approval: same as Done ────────────────────────────────────────
-    if PENDING_APPROVAL_DIR.exists():
-        for meta_path in PENDING_APPROVAL_DIR.glob("*_meta.md"):
-            if _read_source_file_from_meta(meta_path) != deleted_name:
-                continue
-            dest_path_str = _read_destination_path_from_meta(meta_path)
-            if dest_path_str:
-                removed_na_stems.add(Path(dest_path_str).stem)
-            stem = meta_path.stem.replace("_meta", "")
-            safe_unlink(meta_path)
-            for task_path in PENDING_APPROVAL_DIR.glob(f"{stem}.*"):
-                if task_path.suffix.lower() != ".md":
-                    safe_unlink(task_path)
-            plan_here = PENDING_APPROVAL_DIR / f"{stem}_plan.md"
-            safe_unlink(plan_here)
-            plan_in_plans = PLANS_DIR / f"{stem}_plan.md"
-            safe_unlink(plan_in_plans)
-
-    # ── task_catalog.jsonl: drop lines whose "file" stem is in removed_na_stems ─
-    if CATALOG_FILE.exists() and removed_na_stems:
-        try:
-            lines = CATALOG_FILE.read_text(encoding="utf-8").strip().splitlines()
-            kept = []
-            for line in lines:
-                if not line.strip():
-                    continue
-                try:
-                    obj = json.loads(line)
-                    file_val = obj.get("file", "")
-                    stem = Path(file_val).stem
-                    if stem in removed_na_stems:
-                        logger.info(f"  ✔ Removed catalog entry: {file_val}")
-                        continue
-                    kept.append(line)
-                except json.JSONDecodeError:
-                    kept.append(line)
-            CATALOG_FILE.write_text("\n".join(kept) + ("\n" if kept else ""), encoding="utf-8")
-        except Exception as exc:
-            logger.warning(f"  ✘ Could not update task_catalog.jsonl: {exc}")
+        # ── task_catalog.jsonl: drop lines whose "file" stem is in removed_na_stems ─
+        if CATALOG_FILE.exists() and removed_na_stems:
+            _filter_catalog(frozenset(removed_na_stems))
 
     # ── Refresh Dashboard ────────────────────────────────────────────────────
     refresh_dashboard()
@@ -362,13 +671,35 @@ class InboxEventHandler(FileSystemEventHandler):
       • All errors are caught and logged; never crash the observer thread.
     """
 
+    # Only these reach the handler; the inotify/FSEvents mask is narrowed to
+    # match, so open/close/attrib traffic never leaves the kernel
+    EVENT_TYPES = [FileCreatedEvent, FileModifiedEvent, FileDeletedEvent]
+
     # Files / extensions to silently ignore
     _IGNORE_NAMES = frozenset({".DS_Store", "Thumbs.db", ".gitkeep", ".gitignore"})
-    _IGNORE_EXT   = frozenset({".tmp", ".part", ".crdownload", ".swp"})
+    # Temp/partial downloads, plus the metadata cards we write ourselves
+    _IGNORE_SUFFIXES = (".tmp", ".part", ".crdownload", ".swp", "_meta.md")
 
     def __init__(self):
         super().__init__()
+        # Both keyed by _path_key(); _in_flight is guarded by _lock because
+        # handlers may run on several threads
+        self._lock = threading.Lock()
         self._in_flight: set[str] = set()   # Paths currently being processed
+        self._last_mod: dict[str, float] = {}   # Path → monotonic time of last modified event
+        self._pool = ThreadPoolExecutor(max_workers=INGEST_WORKERS,
+                                        thread_name_prefix="vault-io")
+        self._agent_queue: queue.Queue[str | None] = queue.Queue()
+        self._agent_thread = threading.Thread(
+            target=self._agent_worker, name="agent-batch", daemon=True
+        )
+        self._agent_thread.start()
+
+    def stop(self) -> None:
+        """Finish in-progress ingests, process anything queued for the agent, then stop."""
+        self._pool.shutdown(wait=True)
+        self._agent_queue.put(None)
+        self._agent_thread.join()
 
     # ── public ──────────────────────────────────────────────────────────────
 
@@ -378,16 +709,31 @@ class InboxEventHandler(FileSystemEventHandler):
         filepath = Path(event.src_path)
         if self._should_ignore(filepath):
             return
-        if str(filepath) in self._in_flight:
-            return
+        key = self._path_key(filepath)
+        with self._lock:
+            if key in self._in_flight:
+                return
+            self._in_flight.add(key)
+        # Copy + hash run on the pool (hashlib and file I/O release the GIL),
+        # leaving the observer thread free to dispatch modified events
+        self._pool.submit(self._ingest, filepath, key)
 
-        self._in_flight.add(str(filepath))
+    def _ingest(self, filepath: Path, key: str) -> None:
         try:
             self._handle_new_file(filepath)
         except Exception as exc:
             logger.error(f"Unhandled error for {filepath.name}: {exc}", exc_info=True)
         finally:
-            self._in_flight.discard(str(filepath))
+            with self._lock:
+                self._in_flight.discard(key)
+
+    def on_modified(self, event):
+        """Record write activity; _wait_for_stable() sleeps until it goes quiet."""
+        if event.is_directory:
+            return
+        key = self._path_key(event.src_path)
+        if key in self._in_flight:   # Only files still being waited on
+            self._last_mod[key] = time.monotonic()
 
     def on_deleted(self, event):
         """When an Inbox file is deleted, roll back all processing for that file."""
@@ -409,43 +755,64 @@ class InboxEventHandler(FileSystemEventHandler):
 
     # ── private ─────────────────────────────────────────────────────────────
 
+    @staticmethod
+    def _path_key(path) -> str:
+        """Tracker key: one entry per file even where paths are case-insensitive (Windows)."""
+        return os.path.normcase(os.fspath(path))
+
     def _should_ignore(self, path: Path) -> bool:
+        # Runs for every event, modified floods included: one expression,
+        # cheapest checks first, and a single C-level multi-suffix endswith
         name = path.name
-        if name.startswith("."):
-            return True
-        if name in self._IGNORE_NAMES:
-            return True
-        if path.suffix.lower() in self._IGNORE_EXT:
-            return True
-        # Don't re-process metadata files we ourselves created
-        if name.endswith("_meta.md"):
-            return True
-        return False
+        return (name.startswith(".")
+                or name in self._IGNORE_NAMES
+                or name.lower().endswith(self._IGNORE_SUFFIXES))
 
     def _wait_for_stable(self, path: Path) -> bool:
         """
-        Poll until the file size stops changing, indicating the write is complete.
-        Returns True when stable, False on timeout or disappearance.
+        Wait until the write is complete: the size is unchanged across a quiet
+        window with no modified events. While events keep arriving the thread
+        just sleeps — the file is only stat()ed once per quiet window.
+        Returns True when stable, False on disappearance.
         """
+        key       = self._path_key(path)
+        deadline  = time.monotonic() + FILE_STABILISE_TIMEOUT
         prev_size = -1
-        elapsed   = 0.0
-        while elapsed < FILE_STABILISE_TIMEOUT:
-            try:
-                size = path.stat().st_size
-                if size == prev_size:
-                    return True
-                prev_size = size
-            except FileNotFoundError:
-                logger.warning(f"File vanished while waiting: {path.name}")
-                return False
-            except Exception as exc:
-                logger.warning(f"Stability check error: {exc}")
-            time.sleep(FILE_STABILISE_INTERVAL)
-            elapsed += FILE_STABILISE_INTERVAL
+        try:
+            while True:
+                try:
+                    size = path.stat().st_size
+                    if size == prev_size:
+                        return True
+                    prev_size = size
+                except FileNotFoundError:
+                    logger.warning(f"File vanished while waiting: {path.name}")
+                    return False
+                except Exception as exc:
+                    logger.warning(f"Stability check error: {exc}")
+                if not self._sleep_until_quiet(key, deadline):
+                    break
+        finally:
+            self._last_mod.pop(key, None)
 
         logger.warning(f"Stability timeout for {path.name}; proceeding anyway")
         return True   # Timeout is non-fatal; try to copy whatever is there
 
+    def _sleep_until_quiet(self, key: str, deadline: float) -> bool:
+        """
+        Sleep until FILE_STABILISE_INTERVAL has passed with no modified event
+        for key. Returns False if the deadline arrives first.
+        """
+        start = time.monotonic()
+        while True:
+            quiet_at = max(start, self._last_mod.get(key, 0.0)) + FILE_STABILISE_INTERVAL
+            now = time.monotonic()
+            if quiet_at > deadline:
+                return False
+            if now >= quiet_at:
+                return True
+            time.sleep(quiet_at - now)
+
     def _handle_new_file(self, source: Path):
         """Core pipeline: detect → validate → refresh dashboard → copy → metadata → log."""
         logger.info(f"▶ New file detected: {source.name}")
@@ -462,7 +829,8 @@ class InboxEventHandler(FileSystemEventHandler):
         refresh_dashboard()
 
         # Build collision-safe destination name using timestamp prefix
-        ts        = datetime.now().strftime("%Y%m%d_%H%M%S")
+        detected  = datetime.now()
+        ts        = detected.strftime("%Y%m%d_%H%M%S")
         safe_stem = sanitize_filename(source.stem)
         dest_name = f"{ts}_{safe_stem}{source.suffix}"
         meta_name = f"{ts}_{safe_stem}_meta.md"
@@ -476,38 +844,90 @@ class InboxEventHandler(FileSystemEventHandler):
             logger.info(f"  [DRY_RUN] Would write → Needs_Action/{meta_name}")
             return
 
-        # ── Copy file ───────────────────────────────────────────────────────
+        # ── Copy file (outside the vault lock, under a dot-name the agent skips)
+        part_file = NEEDS_ACTION_DIR / f".{dest_name}.part"
         try:
-            shutil.copy2(source, dest_file)
-            logger.info(f"  ✔ Copied  → Needs_Action/{dest_name}")
+            fhash = _copy_and_hash(source, part_file)
+            dest_size = part_file.stat().st_size
         except Exception as exc:
             logger.error(f"  ✘ Copy failed: {exc}")
+            part_file.unlink(missing_ok=True)
             return
 
-        # ── Write metadata ──────────────────────────────────────────────────
-        try:
-            meta_content = generate_metadata_md(source, dest_file)
-            meta_file.write_text(meta_content, encoding="utf-8")
-            logger.info(f"  ✔ Metadata → Needs_Action/{meta_name}")
-        except Exception as exc:
-            # Non-fatal: the copy succeeded; metadata failure should not block
-            logger.error(f"  ✘ Metadata write failed (non-fatal): {exc}")
+        # Task file and its card land together, never split by an agent run
+        with _vault_lock:
+            # Deleted mid-copy: its rollback already ran (it takes this lock
+            # too) and found nothing, so the task must not be published now
+            if not source.exists():
+                logger.warning(f"  Source deleted during copy, discarding: {source.name}")
+                part_file.unlink(missing_ok=True)
+                return
 
-        # ── Refresh Dashboard so it reflects new Needs_Action count ──────────
-        refresh_dashboard()
+            try:
+                os.replace(part_file, dest_file)
+                logger.info(f"  ✔ Copied  → Needs_Action/{dest_name}")
+            except Exception as exc:
+                logger.error(f"  ✘ Copy failed: {exc}")
+                part_file.unlink(missing_ok=True)
+                return
 
-        # ── Run Claude agent to process the new task(s) in Needs_Action ───────
-        run_agent()
+            # ── Write metadata ──────────────────────────────────────────────
+            try:
+                meta_content = generate_metadata_md(source, dest_file, fhash, detected, dest_size)
+                meta_file.write_text(meta_content, encoding="utf-8")
+                logger.info(f"  ✔ Metadata → Needs_Action/{meta_name}")
+            except Exception as exc:
+                # Non-fatal: the copy succeeded; metadata failure should not block
+                logger.error(f"  ✘ Metadata write failed (non-fatal): {exc}")
+
+            # ── Index for rollback (the agent adds what it creates later) ───
+            agent = _load_agent()
+            if agent is not None:
+                agent.ArtifactIndex.record(dest_name, [dest_file, meta_file], source.name)
+                # A dashboard scan between the rename and the card write may
+                # have cached a listing without the card; the directory mtime
+                # alone won't catch that on coarse-timestamp filesystems
+                agent.VaultReader.invalidate(NEEDS_ACTION_DIR)
 
-        # ── Update Dashboard after task processing (same as rollback) ──────────
+        # ── Refresh Dashboard so it reflects new Needs_Action count ──────────
         refresh_dashboard()
 
+        # ── Queue for the next batched Claude agent run ──────────────────────
+        self._agent_queue.put(dest_name)
+
         # [RW_HOOK] Gold tier: emit event to Ralph Wiggum loop here
         logger.info(
             f"  ✅ Done | {source.name} → Needs_Action/{dest_name} "
-            f"[{dest_file.stat().st_size:,} bytes]"
+            f"[{dest_size:,} bytes]"
         )
 
+    def _agent_worker(self) -> None:
+        """
+        Batch worker: after the first queued file, keep collecting until the
+        queue is quiet for AGENT_BATCH_SECONDS or AGENT_BATCH_SIZE files are
+        waiting, then run the agent once for all of them. None stops the worker.
+        """
+        while True:
+            batch = [self._agent_queue.get()]
+            while batch[-1] is not None and len(batch) < AGENT_BATCH_SIZE:
+                try:
+                    batch.append(self._agent_queue.get(timeout=AGENT_BATCH_SECONDS))
+                except queue.Empty:
+                    break
+            names = [name for name in batch if name is not None]
+            try:
+                if names:
+                    logger.info(f"▶ Agent batch: {len(names)} new task(s)")
+                    run_agent()
+                    refresh_dashboard()
+            except Exception as exc:
+                logger.error(f"Agent batch error: {exc}", exc_info=True)
+            finally:
+                for _ in batch:
+                    self._agent_queue.task_done()
+            if batch[-1] is None:
+                return
+
 
 # ──────────────────────────────────────────────────────────────────────────────
 # MAIN
@@ -535,7 +955,10 @@ def main():
 
     handler  = InboxEventHandler()
     observer = Observer()
-    observer.schedule(handler, str(INBOX_DIR), recursive=False)
+    # One observer, Inbox only: a recursive vault watch would also see every
+    # plan, log and dashboard write the pipeline itself makes
+    observer.schedule(handler, str(INBOX_DIR), recursive=False,
+                      event_filter=InboxEventHandler.EVENT_TYPES)
     observer.start()
 
     def _shutdown(signum, frame):
@@ -554,6 +977,8 @@ def main():
         observer.stop()
         observer.join()
 
+    handler.stop()
+    _dashboard_debouncer.flush()
     logger.info("VaultWatcher stopped cleanly. Goodbye.")
 
 